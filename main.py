@@ -6,19 +6,28 @@ content, runs a local profanity check, and sends flagged posts to
 Groq AI for a full moderation report sent to Discord.
 
 Setup:
-  pip install feedparser requests beautifulsoup4
+  pip install feedparser aiohttp selectolax xxhash orjson
 
 Credentials are loaded from environment variables (set these in Railway):
   DISCORD_WEBHOOK_URL
   GROQ_API_KEY
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import json
 import os
-import feedparser
-import requests
+import re
+import sqlite3
 import time
+import aiohttp
+import feedparser
+import orjson
+import xxhash
+from collections import OrderedDict
 from datetime import datetime
-from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser
 
 # ============================================================
 # CONFIG - credentials loaded from environment variables
@@ -29,8 +38,31 @@ DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL")
 GROQ_API_KEY        = os.environ.get("GROQ_API_KEY")
 RSS_FEED_URL        = "https://coastal-anarchy.boards.net/rss/public"
 
-# How often to check for new posts (in seconds)
+# How often to check for new posts (in seconds). When the forum is
+# idle we back off exponentially up to the max.
 CHECK_INTERVAL = 60
+MAX_CHECK_INTERVAL = 600
+
+# Max Groq requests in flight at once (stay under their rate limit)
+GROQ_CONCURRENCY = 5
+
+# Worker processes for HTML parsing, created in run_loop. With fetches
+# overlapped, parsing many thread bodies is the remaining CPU cost and
+# it holds the GIL - spread it across cores. None (e.g. in tests)
+# falls back to the event loop's default thread executor.
+PARSE_POOL: concurrent.futures.ProcessPoolExecutor | None = None
+
+# HTTP behaviour shared by every request we make
+USER_AGENT      = "coastal-anarchy-mod/1.0"
+RETRY_TOTAL     = 3
+RETRY_BACKOFF   = 0.3
+RETRY_STATUSES  = {429, 502, 503, 504}
+
+# Built once so we don't rebuild the dict on every Groq call
+GROQ_HEADERS = {
+    "Authorization": f"Bearer {GROQ_API_KEY}",
+    "Content-Type": "application/json",
+}
 
 # ============================================================
 # PROFANITY WORD LIST (first-pass filter, free, no API needed)
@@ -43,75 +75,303 @@ PROFANITY_LIST = [
     # add more as needed
 ]
 
+# One compiled alternation: a single C-level scan for every word in
+# PROFANITY_LIST. Word boundaries avoid false positives on words like
+# "assessment" or "classic". The pattern and the scan work on bytes:
+# ASCII-lowercasing via a translate table skips building a second
+# (potentially wide-char) str just to call .lower().
+PROFANITY_RE = re.compile(
+    rb"\b(?:" + b"|".join(re.escape(w.encode()) for w in PROFANITY_LIST) + rb")\b"
+)
+
+LOWER_TABLE = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+# Post-header extraction, compiled once: one C-level scan and a Match
+# (or None) instead of split chains with try/except per cell.
+POST_BY_RE = re.compile(r"Post by\s+(.+?)\s+on\b")
+CONTENT_RE = re.compile(r"Back to Top\s*(.*)$", re.DOTALL)
+
+# Bound method hoisted so the hot path is a single C call with no
+# attribute lookup per post.
+_profanity_search = PROFANITY_RE.search
+
 # ============================================================
 # TRACKING - keeps track of individual posts we've already seen
-# Key: (thread_url, author, content_snippet)
+# Stored as 64-bit fingerprints in an insertion-ordered LRU so a
+# long-running bot can't grow without bound, and mirrored to a SQLite
+# file so a redeploy doesn't re-scrape (and re-flag) the whole forum.
 # ============================================================
 
-seen_posts = set()
+SEEN_POSTS_MAX    = 50000
+SEEN_DB_FILE      = "seen.db"
+SEEN_COMMIT_EVERY = 50
+
+seen_posts: OrderedDict[int, None] = OrderedDict()
+
+_seen_conn = sqlite3.connect(SEEN_DB_FILE)
+_seen_conn.execute("CREATE TABLE IF NOT EXISTS seen(fp INTEGER PRIMARY KEY)")
+for _row in _seen_conn.execute("SELECT fp FROM seen ORDER BY rowid"):
+    seen_posts[_row[0]] = None
+# Trim a table left oversized by an earlier run so the on-disk set
+# honours the same cap as the in-memory LRU
+while len(seen_posts) > SEEN_POSTS_MAX:
+    _evicted, _ = seen_posts.popitem(last=False)
+    _seen_conn.execute("DELETE FROM seen WHERE fp = ?", (_evicted,))
+_seen_conn.commit()
+_pending_inserts = 0
+
+
+def _fp(link: str, author: str, content: str) -> int:
+    """64-bit fingerprint identifying one post (signed, SQLite-friendly)."""
+    h = xxhash.xxh3_64_intdigest(f"{link}\0{author}\0{content[:200]}".encode())
+    return h - 0x1_0000_0000_0000_0000 if h & 0x8000_0000_0000_0000 else h
+
+
+def remember_post(fp: int):
+    """Marks a fingerprint as seen, evicting the oldest when full."""
+    global _pending_inserts
+
+    seen_posts[fp] = None
+    seen_posts.move_to_end(fp)
+    if len(seen_posts) > SEEN_POSTS_MAX:
+        # Evict from the table too, or it (and the import-time load)
+        # would grow without bound
+        evicted, _ = seen_posts.popitem(last=False)
+        _seen_conn.execute("DELETE FROM seen WHERE fp = ?", (evicted,))
+
+    _seen_conn.execute("INSERT OR IGNORE INTO seen VALUES (?)", (fp,))
+    _pending_inserts += 1
+    if _pending_inserts >= SEEN_COMMIT_EVERY:
+        _seen_conn.commit()
+        _pending_inserts = 0
+
+# Conditional-GET state: last ETag / Last-Modified seen per URL, plus
+# the parsed posts for threads the server reports as unchanged (304).
+# Both are LRUs capped well above the feed size, so they can't grow
+# for the life of the process the way a plain dict per URL would.
+URL_CACHE_MAX = 1024
+ETAGS: OrderedDict[str, tuple[str, str]] = OrderedDict()
+THREAD_CACHE: OrderedDict[str, list[dict]] = OrderedDict()
+
+
+def _lru_put(cache: OrderedDict, key, value, max_size: int = URL_CACHE_MAX):
+    """Inserts into an LRU cache, evicting the oldest entry when full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
+# Newest RSS stamp we've fully processed; entries at or below it are
+# old, so a newest-first walk of the feed can stop at the first one.
+LAST_HIGH_WATER: time.struct_time | None = None
+_EPOCH = time.gmtime(0)
+
+
+def _entry_stamp(entry) -> time.struct_time:
+    """The parsed updated/published time of a feed entry."""
+    return entry.get("updated_parsed") or entry.get("published_parsed") or _EPOCH
+
+# Groq verdicts already paid for this session, keyed on the post text
+# and author - a retried report must not trigger a second bill.
+GROQ_CACHE: dict[tuple[int, str], str] = {}
+
+# Per-thread "updated" stamp from the RSS entry; a thread is only
+# re-scraped when this changes. Persisted so restarts don't re-fetch
+# the whole forum.
+THREAD_STATE_FILE = "thread_state.json"
+thread_last_seen: dict[str, str] = {}
+
+# Threads whose last fetch failed, keyed by link. They must be carried
+# into the next cycle explicitly: once the high-water mark has moved
+# past them (or the feed answers 304) the entry walk would never reach
+# them again.
+retry_queue: dict[str, tuple] = {}
+
+
+def load_thread_state():
+    """Loads the per-thread updated stamps saved by a previous run."""
+    try:
+        with open(THREAD_STATE_FILE) as f:
+            thread_last_seen.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+
+
+def save_thread_state():
+    """Writes the per-thread updated stamps to disk."""
+    try:
+        with open(THREAD_STATE_FILE, "w") as f:
+            json.dump(thread_last_seen, f)
+    except OSError as e:
+        print(f"  Warning: could not save thread state: {e}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _profanity_cached(text: str) -> bool:
+    lowered = text.encode("utf-8", "replace").translate(LOWER_TABLE)
+    return _profanity_search(lowered) is not None
 
 
 def contains_profanity(text: str) -> bool:
     """Quick local check - no API call needed."""
-    text_lower = text.lower()
-    for word in PROFANITY_LIST:
-        if word in text_lower:
-            return True
-    return False
+    # Unchanged threads hand us the same strings every poll; remember
+    # the verdict instead of re-scanning.
+    return _profanity_cached(text)
 
 
-def scrape_thread(url: str) -> list[dict]:
+async def request_bytes(session: aiohttp.ClientSession, method: str, url: str,
+                        **kwargs) -> bytes | None:
+    """
+    Issues a request on the shared session and returns the body bytes.
+    Transient failures are retried up to RETRY_TOTAL times with
+    exponential backoff: 429/502/503/504 answers for any method, but
+    connection errors and timeouts only for GET - a non-GET whose
+    response was lost may already have taken effect on the server.
+
+    GETs are conditional: we replay the ETag / Last-Modified the server
+    gave us last time, and return None if it answers 304 Not Modified.
+    """
+    if method == "GET" and url in ETAGS:
+        etag, last_modified = ETAGS[url]
+        ETAGS.move_to_end(url)
+        conditional = {}
+        if etag:
+            conditional["If-None-Match"] = etag
+        if last_modified:
+            conditional["If-Modified-Since"] = last_modified
+        if conditional:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **conditional}
+    last_error: Exception = aiohttp.ClientError(f"request to {url} failed")
+    for attempt in range(RETRY_TOTAL):
+        if attempt:
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** (attempt - 1)))
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                if response.status in RETRY_STATUSES:
+                    last_error = aiohttp.ClientResponseError(
+                        response.request_info, response.history,
+                        status=response.status, message=response.reason or "",
+                    )
+                    continue
+                if response.status == 304:
+                    return None
+                response.raise_for_status()
+                body = await response.read()
+                if method == "GET":
+                    validators = (response.headers.get("ETag", ""),
+                                  response.headers.get("Last-Modified", ""))
+                    if any(validators):
+                        _lru_put(ETAGS, url, validators)
+                return body
+        except aiohttp.ClientResponseError:
+            raise  # non-transient HTTP error, don't retry
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # asyncio.TimeoutError: ClientTimeout expiry is not a
+            # ClientError subclass but is exactly as transient.
+            # Only GETs are safe to replay here: a POST whose response
+            # was lost may already have taken effect (duplicate Discord
+            # report, double-billed Groq completion).
+            if method != "GET":
+                raise
+            last_error = e
+    raise last_error
+
+
+async def scrape_thread(session: aiohttp.ClientSession, url: str) -> list[dict]:
     """
     Fetches a thread page and returns a list of posts.
     Each post is a dict with 'author' and 'content' keys.
+
+    Fetch failures propagate to the caller: an error must stay
+    distinguishable from an empty thread, or the updated-stamp and
+    high-water bookkeeping would mark the thread as handled and its
+    posts would go unreported until someone bumps it again.
     """
-    try:
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
-    except Exception as e:
-        print(f"  ❌ Could not fetch thread page: {e}")
+    body = await request_bytes(session, "GET", url,
+                               timeout=aiohttp.ClientTimeout(total=15))
+
+    if body is None:
+        # 304 Not Modified - reuse the posts we parsed last time
+        posts = THREAD_CACHE.get(url)
+        if posts is None:
+            return []
+        THREAD_CACHE.move_to_end(url)
+        return posts
+
+    # Cheap substring check (a single C memmem) before paying for a
+    # parse: error pages, locked boards and interstitials contain no
+    # post cells at all.
+    if b"message_inner" not in body and b"Post by" not in body:
+        _lru_put(THREAD_CACHE, url, [])
         return []
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    posts = []
+    # Parse off the event loop - and off this core - so many thread
+    # bodies arriving at once are chewed through in parallel.
+    loop = asyncio.get_running_loop()
+    posts = await loop.run_in_executor(PARSE_POOL, parse_thread, body)
+    _lru_put(THREAD_CACHE, url, posts)
+    return posts
 
-    for td in soup.find_all("td"):
-        text = td.get_text(separator=" ", strip=True)
 
-        if len(text) < 20:
-            continue
+def _node_text(node) -> str:
+    """Collapsed text content of a node, like get_text(' ', strip=True)."""
+    return " ".join(node.text(separator=" ").split())
 
-        if "Post by" not in text:
-            continue
 
-        # Extract author from "Post by X on date"
-        author = "Unknown"
-        try:
-            after = text.split("Post by")[1]
-            author = after.split("on")[0].strip()
-        except Exception:
-            pass
+def parse_thread(body: bytes) -> list[dict]:
+    """
+    Pulls posts out of a thread page with selectolax - the whole parse
+    and CSS select run in C with one thin Python object per post cell.
+    """
+    tree = HTMLParser(body)
+    posts = []
 
-        # Extract content after the post header
-        try:
-            content = text.split("Back to Top")[1].strip() if "Back to Top" in text else text
-        except Exception:
-            content = text
+    for node in tree.css("td.message_inner"):
+        # Author lives in the user_details cell of the same row; fall
+        # back to the "Post by X on date" header text for old themes.
+        author_node = node.parent.css_first("td.user_details a") if node.parent else None
+        if author_node:
+            author = _node_text(author_node)
+        else:
+            m = POST_BY_RE.search(_node_text(node))
+            author = m.group(1).strip() if m else "Unknown"
+
+        body_node = node.css_first("div.post_body")
+        content = _node_text(body_node if body_node else node)
 
         if content:
             posts.append({"author": author, "content": content})
 
+    if not posts:
+        # Fallback for themes that don't use message_inner cells
+        for node in tree.css("td"):
+            text = _node_text(node)
+
+            if len(text) < 20:
+                continue
+
+            m = POST_BY_RE.search(text)
+            if not m:
+                continue
+            author = m.group(1).strip()
+
+            cm = CONTENT_RE.search(text)
+            content = cm.group(1).strip() if cm else text
+
+            if content:
+                posts.append({"author": author, "content": content})
+
     return posts
 
 
-def ask_groq(post_text: str, author: str) -> str:
+async def ask_groq(session: aiohttp.ClientSession, post_text: str, author: str) -> str:
     """
     Sends the post to Groq and asks for a one-sentence bullying assessment.
     """
-    headers = {
-        "Authorization": f"Bearer {GROQ_API_KEY}",
-        "Content-Type": "application/json",
-    }
+    cache_key = (hash(post_text), author)
+    cached = GROQ_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
     prompt = (
         f"You are a school forum moderator. A student named '{author}' posted:\n\n"
@@ -128,21 +388,24 @@ def ask_groq(post_text: str, author: str) -> str:
     }
 
     try:
-        response = requests.post(
+        raw = await request_bytes(
+            session, "POST",
             "https://api.groq.com/openai/v1/chat/completions",
-            headers=headers,
-            json=body,
-            timeout=30,
+            headers=GROQ_HEADERS,
+            data=orjson.dumps(body),
+            timeout=aiohttp.ClientTimeout(total=30),
         )
-        response.raise_for_status()
-        data = response.json()
-        return data["choices"][0]["message"]["content"].strip()
+        data = orjson.loads(raw)
+        summary = data["choices"][0]["message"]["content"].strip()
+        GROQ_CACHE[cache_key] = summary
+        return summary
     except Exception as e:
         return f"[Error contacting Groq: {e}]"
 
 
-def send_discord_report(post_time: str, author: str,
-                        profanity: bool, bullying_summary: str, post_url: str):
+async def send_discord_report(session: aiohttp.ClientSession,
+                              post_time: str, author: str,
+                              profanity: bool, bullying_summary: str, post_url: str):
     """Sends a moderation report to the Discord webhook."""
 
     report = (
@@ -156,58 +419,210 @@ def send_discord_report(post_time: str, author: str,
     )
 
     try:
-        response = requests.post(DISCORD_WEBHOOK_URL, json={"content": report}, timeout=10)
-        response.raise_for_status()
+        await request_bytes(
+            session, "POST", DISCORD_WEBHOOK_URL,
+            data=orjson.dumps({"content": report}),
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
         print(f"  ✅ Report sent to Discord.")
     except Exception as e:
         print(f"  ❌ Failed to send Discord report: {e}")
 
 
-def check_feed():
-    """Fetches the RSS feed and scrapes all threads for new posts."""
+async def check_feed(session: aiohttp.ClientSession) -> int:
+    """
+    Fetches the RSS feed and scrapes all threads for new posts.
+    Returns the number of new posts found, so the caller can slow the
+    poll down when nothing is happening.
+    """
     print(f"[{datetime.now().strftime('%H:%M:%S')}] Checking feed...")
 
+    # Fetch over the shared keep-alive session (same connection as the
+    # thread pages) instead of feedparser's own urllib fetch; the
+    # helper's conditional GET turns idle polls into 304s.
     try:
-        feed = feedparser.parse(RSS_FEED_URL)
+        raw = await request_bytes(session, "GET", RSS_FEED_URL,
+                                  timeout=aiohttp.ClientTimeout(total=15))
     except Exception as e:
         print(f"  ❌ Could not fetch RSS feed: {e}")
-        return
-
-    for entry in feed.entries:
-        link      = entry.get("link", "")
+        return 0
+
+    if raw is None and not retry_queue:
+        # 304 - nothing new on the forum since last poll
+        return 0
+
+    # Walk the feed newest-first and stop at the first entry we already
+    # processed last cycle - on an idle forum that's entry 0. Within the
+    # new slice, only scrape threads whose "updated" stamp changed.
+    global LAST_HIGH_WATER
+
+    entries = sorted(feedparser.parse(raw).entries, key=_entry_stamp,
+                     reverse=True) if raw is not None else []
+    high_water = LAST_HIGH_WATER or _EPOCH
+
+    changed = []
+    for entry in entries:
+        stamp = _entry_stamp(entry)
+        if LAST_HIGH_WATER is not None and stamp <= LAST_HIGH_WATER:
+            break
+        link    = entry.get("link", "")
+        updated = entry.get("updated", entry.get("published", ""))
+        if link and thread_last_seen.get(link) == updated:
+            if stamp > high_water:
+                high_water = stamp
+            continue
+        changed.append((entry, link, updated, stamp))
+
+    # Threads that failed last cycle get another go even though the
+    # entry walk no longer reaches them
+    links_this_cycle = {link for _, link, _, _ in changed}
+    changed.extend(item for link, item in retry_queue.items()
+                   if link not in links_this_cycle)
+
+    # Fetch every changed thread concurrently - wall time is the
+    # slowest fetch, not the sum of all of them.
+    tasks = [scrape_thread(session, link) for _, link, _, _ in changed]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    state_dirty = False
+    new_posts = 0
+    flagged = []
+    for (entry, link, updated, stamp), posts in zip(changed, results):
         published = entry.get("published", "Unknown time")
         title     = entry.get("title", "No title")
 
-        # Always scrape every thread to catch new replies
-        posts = scrape_thread(link)
+        if isinstance(posts, BaseException):
+            print(f"  ❌ Could not process thread {link}: {posts}")
+            retry_queue[link] = (entry, link, updated, stamp)
+            continue
+
+        # Scrape succeeded - don't re-fetch until the stamp changes again
+        retry_queue.pop(link, None)
+        thread_last_seen[link] = updated
+        state_dirty = True
+        if stamp > high_water:
+            high_water = stamp
 
         for post in posts:
             author  = post["author"]
             content = post["content"]
 
             # Use a fingerprint to uniquely identify this post
-            fingerprint = (link, author, content[:100])
+            fingerprint = _fp(link, author, content)
 
             if fingerprint in seen_posts:
                 continue
 
             # It's a new post - add to seen
-            seen_posts.add(fingerprint)
+            remember_post(fingerprint)
+            new_posts += 1
 
             if not contains_profanity(content):
                 continue
 
             print(f"  ⚠️  Profanity detected in post by {author} in '{title}'! Sending to Groq...")
+            flagged.append((post, published, link))
 
-            bullying_summary = ask_groq(content, author)
+    if flagged:
+        # Ask Groq about every flagged post at once (bounded by the
+        # semaphore), then fire all the Discord reports together.
+        sem = asyncio.Semaphore(GROQ_CONCURRENCY)
 
+        async def limited_ask(post: dict) -> str:
+            async with sem:
+                return await ask_groq(session, post["content"], post["author"])
+
+        # One Groq call per unique (content, author) pair - quoted
+        # reposts across threads share a single verdict.
+        unique: dict[int, dict] = {}
+        for post, _, _ in flagged:
+            unique.setdefault(hash((post["content"], post["author"])), post)
+
+        summaries = await asyncio.gather(*(limited_ask(post) for post in unique.values()))
+        summary_by_key = dict(zip(unique, summaries))
+
+        await asyncio.gather(*(
             send_discord_report(
+                session,
                 post_time        = published,
-                author           = author,
+                author           = post["author"],
                 profanity        = True,
-                bullying_summary = bullying_summary,
+                bullying_summary = summary_by_key[hash((post["content"], post["author"]))],
                 post_url         = link,
             )
+            for post, published, link in flagged
+        ))
+
+    if state_dirty:
+        save_thread_state()
+
+    # Raise the mark from entries we actually handled this cycle
+    if high_water != _EPOCH:
+        LAST_HIGH_WATER = high_water
+
+    return new_posts
+
+
+async def run_loop():
+    """Runs the poll loop with a single long-lived HTTP session."""
+    global PARSE_POOL
+
+    connector = aiohttp.TCPConnector(limit=20, limit_per_host=10)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        PARSE_POOL = pool
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": USER_AGENT},
+        ) as session:
+            # Initial scan - load all existing posts so we don't re-flag old
+            # content. Skipped entirely when the seen database already has
+            # history from a previous run.
+            if seen_posts:
+                print(f"Loaded {len(seen_posts)} previously seen posts from "
+                      f"{SEEN_DB_FILE}; skipping initial scan.\n")
+            else:
+                print("Initial scan (loading existing posts to avoid re-flagging)...")
+                try:
+                    raw = await request_bytes(session, "GET", RSS_FEED_URL,
+                                              timeout=aiohttp.ClientTimeout(total=15))
+                    feed = feedparser.parse(raw or b"")
+                    links = [entry.get("link", "") for entry in feed.entries]
+                    results = await asyncio.gather(
+                        *(scrape_thread(session, link) for link in links),
+                        return_exceptions=True,
+                    )
+                    count = 0
+                    for link, posts in zip(links, results):
+                        if isinstance(posts, BaseException):
+                            continue
+                        for post in posts:
+                            remember_post(_fp(link, post["author"], post["content"]))
+                            count += 1
+                    print(f"  Loaded {count} existing posts across {len(feed.entries)} threads. Now monitoring for new ones.\n")
+                except Exception as e:
+                    print(f"  Warning: Could not load existing posts: {e}\n")
+
+            load_thread_state()
+            idle_cycles = 0
+            try:
+                while True:
+                    new_posts = await check_feed(session)
+
+                    # Nothing new? Back off exponentially so an idle forum
+                    # isn't polled at full rate all night.
+                    if new_posts == 0:
+                        interval = min(MAX_CHECK_INTERVAL,
+                                       CHECK_INTERVAL * (2 ** min(idle_cycles, 4)))
+                        idle_cycles += 1
+                    else:
+                        interval = CHECK_INTERVAL
+                        idle_cycles = 0
+
+                    await asyncio.sleep(interval)
+            finally:
+                save_thread_state()
+                _seen_conn.commit()
 
 
 def main():
@@ -224,25 +639,7 @@ def main():
     print(f"  Checking every {CHECK_INTERVAL} seconds")
     print("  Press Ctrl+C to stop.\n")
 
-    # Initial scan - load all existing posts so we don't re-flag old content
-    print("Initial scan (loading existing posts to avoid re-flagging)...")
-    try:
-        feed = feedparser.parse(RSS_FEED_URL)
-        count = 0
-        for entry in feed.entries:
-            link = entry.get("link", "")
-            posts = scrape_thread(link)
-            for post in posts:
-                fingerprint = (link, post["author"], post["content"][:100])
-                seen_posts.add(fingerprint)
-                count += 1
-        print(f"  Loaded {count} existing posts across {len(feed.entries)} threads. Now monitoring for new ones.\n")
-    except Exception as e:
-        print(f"  Warning: Could not load existing posts: {e}\n")
-
-    while True:
-        check_feed()
-        time.sleep(CHECK_INTERVAL)
+    asyncio.run(run_loop())
 
 
 if __name__ == "__main__":